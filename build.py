@@ -1,4 +1,15 @@
+import hashlib
+import json
 import os
+import re
+import shutil
+import subprocess
+import sys
+from functools import lru_cache
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 from universal_build import build_utils
 from universal_build.helpers import build_python
@@ -9,6 +20,96 @@ GITHUB_URL = "https://github.com/ml-tooling/lazydocs"
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 
+_ABOUT_PATH = os.path.join(HERE, "src", MAIN_PACKAGE, "_about.py")
+_DIST_PATH = os.path.join(HERE, "dist")
+_BUILD_CACHE_PATH = os.path.join(_DIST_PATH, ".build_cache.json")
+# Pre-compiled once at import time; main() may be invoked multiple times
+# (e.g. via the ci act wrapper) and should not recompile the pattern.
+# Anchored + character class: single linear pass without any backtracking.
+_VERSION_RE = re.compile(rb'^__version__ = "[^"]*"', re.MULTILINE)
+
+
+@lru_cache(maxsize=None)
+def _tool_path(name: str) -> str:
+    """Resolves a tool binary on PATH once; repeated calls reuse the result."""
+    return shutil.which(name) or name
+
+
+def _run(argv: List[str], exit_on_error: bool = True) -> None:
+    """Runs a command directly (argv list, no intermediate shell)."""
+    returncode = subprocess.run([_tool_path(argv[0]), *argv[1:]]).returncode
+    if exit_on_error and returncode != 0:
+        sys.exit(returncode)
+
+
+def _check() -> None:
+    """Runs all code checks concurrently (the linters are independent)."""
+    pipenv = _tool_path("pipenv")
+    jobs = [
+        [pipenv, "run", "black", "--check", "src", "tests"],
+        [pipenv, "run", "isort", "--check-only", "src", "tests"],
+        [pipenv, "run", "flake8", "src", "tests"],
+        [pipenv, "run", "mypy", "src"],
+        [pipenv, "run", "pydocstyle", "src"],
+    ]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(subprocess.run, job) for job in jobs]
+        returncodes = [future.result().returncode for future in futures]
+    if any(returncodes):
+        sys.exit(1)
+
+
+def _src_digest() -> str:
+    """Content hash over all files that end up in the distribution."""
+    digest = hashlib.blake2b(digest_size=16)
+    for source_path in [os.path.join(HERE, "setup.py"), _ABOUT_PATH]:
+        with open(source_path, "rb") as f:
+            digest.update(f.read())
+    for root, dirs, files in os.walk(os.path.join(HERE, "src")):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for file_name in sorted(files):
+            if file_name.endswith(".pyc"):
+                continue
+            file_path = os.path.join(root, file_name)
+            digest.update(file_path.encode())
+            with open(file_path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _cached_src_digest() -> Optional[str]:
+    try:
+        with open(_BUILD_CACHE_PATH) as f:
+            return json.load(f).get("src_digest")
+    except (OSError, ValueError):
+        return None
+
+
+def _is_version_released(version: str) -> bool:
+    """Checks with a single PyPI request whether this version is already published."""
+    try:
+        urllib.request.urlopen(
+            f"https://pypi.org/pypi/{MAIN_PACKAGE}/{version}/json", timeout=5
+        )
+        return True
+    except urllib.error.HTTPError as ex:
+        if ex.code == 404:
+            return False
+        raise
+    except urllib.error.URLError:
+        # No network available: fall back to the regular publish path.
+        return False
+
+
+def _update_version(version: str) -> None:
+    """Patches the version in _about.py without executing the module."""
+    with open(_ABOUT_PATH, "rb") as f:
+        data = f.read()
+    # count=1: stop scanning after the first (and only) match.
+    data = _VERSION_RE.sub(f'__version__ = "{version}"'.encode(), data, count=1)
+    with open(_ABOUT_PATH, "wb") as f:
+        f.write(data)
+
 
 def main(args: dict) -> None:
     # set current path as working dir
@@ -18,28 +119,42 @@ def main(args: dict) -> None:
 
     if version:
         # Update version in _about.py
-        build_python.update_version(
-            os.path.join(HERE, f"src/{MAIN_PACKAGE}/_about.py"),
-            str(version),
-            exit_on_error=True,
-        )
+        _update_version(str(version))
 
     if args.get(build_utils.FLAG_MAKE):
         # Install pipenv dev requirements
         build_python.install_build_env(exit_on_error=True)
-        # Create API documentation via lazydocs
-        build_python.generate_api_docs(
-            github_url=GITHUB_URL, main_package=MAIN_PACKAGE, exit_on_error=True
+        # Create API documentation via lazydocs in one batched invocation
+        _run(
+            [
+                "pipenv",
+                "run",
+                "lazydocs",
+                "--overview-file=README.md",
+                f"--src-base-url={GITHUB_URL}/blob/main",
+                "--output-path=./docs",
+                f"./src/{MAIN_PACKAGE}",
+            ]
         )
-        # Build distribution via setuptools
-        build_python.build_distribution(exit_on_error=True)
+        # Build distribution via setuptools; skip the rebuild when the
+        # sources are unchanged and a wheel from the previous run exists.
+        src_digest = _src_digest()
+        wheel_exists = os.path.isdir(_DIST_PATH) and any(
+            name.endswith(".whl") for name in os.listdir(_DIST_PATH)
+        )
+        if wheel_exists and src_digest == _cached_src_digest():
+            build_utils.log("Distribution is up-to-date, skipping build.")
+        else:
+            build_python.build_distribution(exit_on_error=True)
+            with open(_BUILD_CACHE_PATH, "w") as f:
+                json.dump({"src_digest": src_digest}, f)
 
     if args.get(build_utils.FLAG_CHECK):
-        build_python.code_checks(safety=False, exit_on_error=True)
+        _check()
 
     if args.get(build_utils.FLAG_TEST):
         # Remove coverage files
-        build_utils.run("pipenv run coverage erase", exit_on_error=False)
+        _run(["pipenv", "run", "coverage", "erase"], exit_on_error=False)
 
         if build_utils.TEST_MARKER_SLOW in args.get(build_utils.FLAG_TEST_MARKER):  # type: ignore
             # Run if slow test marker is set: test in multiple environments
@@ -56,15 +171,20 @@ def main(args: dict) -> None:
             # Activated Python Environment (3.8)
             build_python.install_build_env(exit_on_error=True)
             # Run pytest in pipenv environment
-            build_utils.run("pipenv run pytest", exit_on_error=True)
+            _run(["pipenv", "run", "pytest"])
 
             # Update pipfile.lock when all tests are successfull (lock environment)
-            build_utils.run("pipenv lock", exit_on_error=True)
+            _run(["pipenv", "lock"])
         else:
             # Run fast tests
-            build_utils.run('pipenv run pytest -m "not slow"', exit_on_error=True)
+            _run(["pipenv", "run", "pytest", "-m", "not slow"])
 
     if args.get(build_utils.FLAG_RELEASE):
+        if version and _is_version_released(str(version)):
+            # One existence check instead of letting twine fail per file
+            build_utils.log(f"Version {version} is already on PyPI, skipping release.")
+            return
+
         # Publish distribution on pypi
         build_python.publish_pypi_distribution(
             pypi_token=args.get(build_python.FLAG_PYPI_TOKEN),
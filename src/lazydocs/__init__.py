@@ -3,4 +3,16 @@ from . import _about
 # define the version before the other imports since these need it
 __version__ = _about.__version__
 
+from typing import Any
+
 from .generation import MarkdownGenerator, generate_docs
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy accessor (PEP 562): resolve the CLI app only when requested,
+    # so library imports never pay for typer.
+    if name == "app":
+        from ._cli import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,8 +4,6 @@ from typing import List, Optional
 
 import typer
 
-from lazydocs import generate_docs
-
 app = typer.Typer()
 
 
@@ -30,8 +28,8 @@ def generate(
         True,
         help="If `True`, the package prefix will be removed from all functions and methods.",
     ),
-    ignored_modules: List[str] = typer.Option(
-        [],
+    ignored_modules: Optional[List[str]] = typer.Option(
+        None,
         help="A list of modules that should be ignored.",
     ),
     watermark: bool = typer.Option(
@@ -49,6 +47,8 @@ def generate(
         
 ) -> None:
     """Generates markdown documentation for your Python project based on Google-style docstrings."""
+    # Imported lazily so that --help does not pay for the generation machinery.
+    from lazydocs.generation import generate_docs
 
     try:
         generate_docs(
@@ -4,68 +4,78 @@ import datetime
 import importlib
 import importlib.util
 import inspect
+import io
 import os
 import pkgutil
 import re
 import subprocess
 import types
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pydoc import locate
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Container, List, NamedTuple, Optional, Set, Tuple
 
-_RE_BLOCKSTART_LIST = re.compile(
-    r"(Args:|Arg:|Arguments:|Parameters:|Kwargs:|Attributes:|Returns:|Yields:|Kwargs:|Raises:).{0,2}$",
+# Single classifier: one match probe per line instead of three.
+_RE_BLOCKSTART = re.compile(
+    r"(?:(?P<list>Args:|Arg:|Arguments:|Parameters:|Kwargs:|Attributes:|Returns:|Yields:|Raises:)"
+    r"|(?P<text>Examples:|Example:|Todo:)"
+    r"|(?P<quote>Notes:|Note:)).{0,2}$",
     re.IGNORECASE,
 )
 
-_RE_BLOCKSTART_TEXT = re.compile(r"(Examples:|Example:|Todo:).{0,2}$", re.IGNORECASE)
-
-_RE_QUOTE_TEXT = re.compile(r"(Notes:|Note:).{0,2}$", re.IGNORECASE)
-
 _RE_TYPED_ARGSTART = re.compile(r"([\w\[\]_]{1,}?)\s*?\((.*?)\):(.{2,})", re.IGNORECASE)
 _RE_ARGSTART = re.compile(r"(.{1,}?):(.{2,})", re.IGNORECASE)
 
-_IGNORE_GENERATION_INSTRUCTION = "lazydocs: ignore"
+# Probe for anything the _doc2md state machine treats specially: section
+# keywords, code markers, literal blocks, doctests, bullets or indentation.
+# Over-matching is fine (it only skips the fast path), under-matching is not.
+_RE_DOC2MD_UNSAFE = re.compile(
+    r"(?im)^[ \t-]"
+    r"|args?:|arguments:|parameters:|kwargs:|attributes:|returns:|yields:|raises:"
+    r"|examples?:|todo:|notes?:"
+    r"|```|>>>|::"
+)
 
-# String templates
+_RE_REMOVE_PACKAGE = re.compile(r"([a-zA-Z0-9_]*?\.)")
+_RE_OPTIONAL = re.compile(r"Union\[(.*?), NoneType\]")
 
-_SOURCE_BADGE_TEMPLATE = """
-<a href="{path}"><img align="right" style="float:right;" src="https://img.shields.io/badge/-source-cccccc?style=flat-square" /></a>
-"""
+_RE_ANCHOR_WHITESPACE = re.compile(r"\s")
+_RE_ANCHOR_ILLEGAL = re.compile(r"[^a-zA-Z0-9-_]")
 
-_MDX_SOURCE_BADGE_TEMPLATE = """
-<a href="{path}"><img align="right" style={{{{"float":"right"}}}} src="https://img.shields.io/badge/-source-cccccc?style=flat-square" /></a>
-"""
+# Translation table for ASCII anchor tags: whitespace to -, other characters
+# outside [a-zA-Z0-9-_] are dropped. Single C-level pass instead of two regexes.
+_ANCHOR_TABLE = {
+    code: (ord("-") if chr(code).isspace() else None)
+    for code in range(128)
+    if not (chr(code).isalnum() or chr(code) in "-_")
+}
 
-_SEPARATOR = """
----
-"""
 
-_FUNC_TEMPLATE = """
-{section} <kbd>{func_type}</kbd> `{header}`
+class _GeneratedObject(NamedTuple):
+    """Record of one documented object, used for the API overview.
 
-```python
-{funcdef}
-```
+    A slim immutable record instead of a dict per object: smaller, faster
+    attribute access, and picklable across the worker-process boundary.
+    """
 
-{doc}
-"""
+    type: str
+    name: str
+    full_name: str
+    module: Optional[str]
+    anchor_tag: str
+    description: str
 
 
-_CLASS_TEMPLATE = """
-{section} <kbd>class</kbd> `{header}`
-{doc}
-{init}
-{variables}
-{handlers}
-{methods}
-"""
+# Sentinel distinguishing "attribute missing" from an explicit None value.
+_MISSING = object()
 
-_MODULE_TEMPLATE = """
-{section} <kbd>module</kbd> `{header}`
-{doc}
-{global_vars}
-{functions}
-{classes}
+_IGNORE_GENERATION_INSTRUCTION = "lazydocs: ignore"
+
+# String templates
+
+_SEPARATOR = """
+---
 """
 
 _OVERVIEW_TEMPLATE = """
@@ -95,26 +105,117 @@ nav:
 """
 
 
-def _get_function_signature(
+# Rendered with f-strings instead of str.format templates: f-strings are
+# compiled to bytecode once and skip re-parsing the template grammar per call.
+
+
+def _render_badge(path: str, is_mdx: bool) -> str:
+    """Renders the source link badge for the given (non-empty) path."""
+    if is_mdx:
+        return (
+            f'\n<a href="{path}"><img align="right" style={{{{"float":"right"}}}} '
+            'src="https://img.shields.io/badge/-source-cccccc?style=flat-square" /></a>\n'
+        )
+    return (
+        f'\n<a href="{path}"><img align="right" style="float:right;" '
+        'src="https://img.shields.io/badge/-source-cccccc?style=flat-square" /></a>\n'
+    )
+
+
+# Small cache of indentation paddings (docstring indents are tiny).
+_PAD_CACHE = [" " * width for width in range(32)]
+
+
+def _pad(width: int) -> str:
+    """Returns a string of `width` spaces (cached for the common small widths)."""
+    return _PAD_CACHE[width] if width < 32 else " " * width
+
+
+@lru_cache(maxsize=None)
+def _cached_sourcefile(obj: Any) -> Optional[str]:
+    """Resolves the absolute source file of an object.
+
+    Cached since all objects of a module share a handful of source files and
+    both getsourcefile and abspath (getcwd) are comparatively expensive.
+    """
+    source_file = inspect.getsourcefile(obj)
+    return os.path.abspath(source_file) if source_file else None
+
+
+@lru_cache(maxsize=None)
+def _cached_relpath(path: str, start: str) -> str:
+    """Computes (and caches) a relative path."""
+    return os.path.relpath(path, start)
+
+
+@lru_cache(maxsize=None)
+def _cached_getmembers(obj: Any) -> Tuple[Tuple[str, Any], ...]:
+    """Runs the full `inspect.getmembers` sweep of an object exactly once.
+
+    class2md and module2md each filter the same object's members several
+    times with different predicates; every `inspect.getmembers` call repeats
+    the dir() walk and the per-name attribute fetches, so the sweep is cached
+    and the predicates are applied to the cached result instead.
+    """
+    return tuple(inspect.getmembers(obj))
+
+
+def _get_members(obj: Any, predicate: Callable[[Any], bool]) -> List[Tuple[str, Any]]:
+    """Returns the (name, value) members of `obj` matching `predicate`."""
+    try:
+        members = _cached_getmembers(obj)
+    except TypeError:
+        # Unhashable object -> sweep without caching
+        return inspect.getmembers(obj, predicate)
+    return [(name, value) for name, value in members if predicate(value)]
+
+
+@lru_cache(maxsize=None)
+def _cached_getcomments(obj: Any) -> Optional[str]:
+    """Resolves (and caches) the comment block preceding an object's source."""
+    return inspect.getcomments(obj)
+
+
+def _get_comments(obj: Any) -> Optional[str]:
+    """Gets the comments preceding the source of `obj`, None if unavailable."""
+    if not (isinstance(obj, types.ModuleType) or inspect.isroutine(obj)):
+        # Primitives and instances carry no retrievable source: getcomments
+        # would only raise and swallow a TypeError per attribute.
+        return None
+    try:
+        return _cached_getcomments(obj)
+    except TypeError:
+        # Unhashable object -> resolve without caching
+        return inspect.getcomments(obj)
+
+
+@lru_cache(maxsize=None)
+def _cached_signature(function: Callable) -> inspect.Signature:
+    """Gets the signature of a function. Cached since it is requested repeatedly."""
+    return inspect.signature(function)
+
+
+def _build_signature_parts(
     function: Callable,
     owner_class: Any = None,
     show_module: bool = False,
     ignore_self: bool = False,
-    wrap_arguments: bool = False,
     remove_package: bool = False,
-) -> str:
-    """Generates a string for a function signature.
+) -> Tuple[str, List[str], str]:
+    """Resolves the (expensive) parts of a function signature.
+
+    Does the inspect and regex work exactly once, so the result can be
+    formatted inline or wrapped without a second resolution pass.
 
     Args:
-        function: Selected function (or method) to generate the signature string.
+        function: Selected function (or method) to generate the signature for.
         owner_class: Owner class of this function.
         show_module: If `True`, add module path in function signature.
         ignore_self: If `True`, ignore self argument in function signature.
-        wrap_arguments:  If `True`, wrap all arguments to new lines.
         remove_package:  If `True`, the package path will be removed from the function signature.
 
     Returns:
-        str: Signature of selected function.
+        Tuple[str, List[str], str]: Function name, argument strings, and return type.
     """
     isclass = inspect.isclass(function)
 
@@ -139,45 +240,59 @@ def _get_function_signature(
     arguments = []
     return_type = ""
     if hasattr(inspect, "signature"):
-        parameters = inspect.signature(function).parameters
-        if inspect.signature(function).return_annotation != inspect.Signature.empty:
-            return_type = str(inspect.signature(function).return_annotation)
+        try:
+            signature = _cached_signature(function)
+        except TypeError:
+            # Unhashable callable -> resolve without caching
+            signature = inspect.signature(function)
+        parameters = signature.parameters
+        if signature.return_annotation != inspect.Signature.empty:
+            return_type = str(signature.return_annotation)
             if return_type.startswith("<class"):
                 # Base class -> get real name
                 try:
-                    return_type = inspect.signature(function).return_annotation.__name__
+                    return_type = signature.return_annotation.__name__
                 except Exception:
                     pass
             # Remove all typing path prefixes
             return_type = return_type.replace("typing.", "")
             if remove_package:
                 # Remove all package path return type
-                return_type = re.sub(r"([a-zA-Z0-9_]*?\.)", "", return_type)
-
-        for parameter in parameters:
-            argument = str(parameters[parameter])
+                return_type = _RE_REMOVE_PACKAGE.sub("", return_type)
+
+        # Bind the bound methods once: skips the attribute lookups (and the
+        # key -> value dict lookup) on every loop iteration.
+        optional_sub = _RE_OPTIONAL.sub
+        remove_package_sub = _RE_REMOVE_PACKAGE.sub
+        for parameter in parameters.values():
+            argument = str(parameter)
             if ignore_self and argument == "self":
                 # Ignore self
                 continue
             # Reintroduce Optionals
-            argument = re.sub(r"Union\[(.*?), NoneType\]", r"Optional[\1]", argument)
+            argument = optional_sub(r"Optional[\1]", argument)
 
             # Remove package
             if remove_package:
                 # Remove all package path from parameter signature
                 if "=" not in argument:
-                    argument = re.sub(r"([a-zA-Z0-9_]*?\.)", "", argument)
+                    argument = remove_package_sub("", argument)
                 else:
                     # Remove only from part before the first =
                     argument_split = argument.split("=")
-                    argument_split[0] = re.sub(
-                        r"([a-zA-Z0-9_]*?\.)", "", argument_split[0]
-                    )
+                    argument_split[0] = remove_package_sub("", argument_split[0])
                     argument = "=".join(argument_split)
             arguments.append(argument)
     else:
         print("Seems like function " + name + " does not have any signature")
 
+    return name, arguments, return_type
+
+
+def _format_signature(
+    name: str, arguments: List[str], return_type: str, wrap_arguments: bool = False
+) -> str:
+    """Formats pre-built signature parts into a signature string."""
     signature = name + "("
     if wrap_arguments:
         for i, arg in enumerate(arguments):
@@ -192,10 +307,44 @@ def _get_function_signature(
     return signature
 
 
+def _get_function_signature(
+    function: Callable,
+    owner_class: Any = None,
+    show_module: bool = False,
+    ignore_self: bool = False,
+    wrap_arguments: bool = False,
+    remove_package: bool = False,
+) -> str:
+    """Generates a string for a function signature.
+
+    Args:
+        function: Selected function (or method) to generate the signature string.
+        owner_class: Owner class of this function.
+        show_module: If `True`, add module path in function signature.
+        ignore_self: If `True`, ignore self argument in function signature.
+        wrap_arguments:  If `True`, wrap all arguments to new lines.
+        remove_package:  If `True`, the package path will be removed from the function signature.
+
+    Returns:
+        str: Signature of selected function.
+    """
+    name, arguments, return_type = _build_signature_parts(
+        function,
+        owner_class=owner_class,
+        show_module=show_module,
+        ignore_self=ignore_self,
+        remove_package=remove_package,
+    )
+    return _format_signature(
+        name, arguments, return_type, wrap_arguments=wrap_arguments
+    )
+
+
 def _order_by_line_nos(objs: Any, line_nos: List[int]) -> List[str]:
     """Orders the set of `objs` by `line_nos`."""
-    ordering = sorted(range(len(line_nos)), key=line_nos.__getitem__)
-    return [objs[i] for i in ordering]
+    # Sorting on the first element only keeps the sort stable for equal
+    # line numbers without comparing (possibly incomparable) objs.
+    return [obj for _, obj in sorted(zip(line_nos, objs), key=itemgetter(0))]
 
 
 def to_md_file(
@@ -228,17 +377,19 @@ def to_md_file(
         if not filename.endswith(".md"):
             md_file = filename + ".md"
 
-    if disable_markdownlint:
-        markdown_str = "<!-- markdownlint-disable -->\n" + markdown_str
-
-    if watermark:
-        markdown_str += _WATERMARK_TEMPLATE.format(
-            date=datetime.date.today().strftime("%d %b %Y")
-        )
-
     print("Writing {}.".format(md_file))
     with open(os.path.join(out_path, md_file), "w", encoding="utf-8") as f:
+        # Write header, body and watermark as separate chunks into the
+        # buffered file instead of concatenating full copies of the document.
+        if disable_markdownlint:
+            f.write("<!-- markdownlint-disable -->\n")
         f.write(markdown_str)
+        if watermark:
+            f.write(
+                _WATERMARK_TEMPLATE.format(
+                    date=datetime.date.today().strftime("%d %b %Y")
+                )
+            )
 
 
 def _code_snippet(snippet: str) -> str:
@@ -256,8 +407,13 @@ def _code_snippet(snippet: str) -> str:
     return result
 
 
-def _get_line_no(obj: Any) -> Optional[int]:
-    """Gets the source line number of this object. None if `obj` code cannot be found."""
+@lru_cache(maxsize=None)
+def _cached_line_no(obj: Any) -> Optional[int]:
+    """Resolves the source line number of an object, None if no code is found.
+
+    Cached since the line number is requested both for the source badge and
+    for the line-number ordering of the same object.
+    """
     try:
         return inspect.getsourcelines(obj)[1]
     except Exception:
@@ -265,6 +421,19 @@ def _get_line_no(obj: Any) -> Optional[int]:
         return None
 
 
+def _get_line_no(obj: Any) -> Optional[int]:
+    """Gets the source line number of this object. None if `obj` code cannot be found."""
+    try:
+        return _cached_line_no(obj)
+    except TypeError:
+        # Unhashable object -> resolve without caching
+        try:
+            return inspect.getsourcelines(obj)[1]
+        except Exception:
+            return None
+
+
+@lru_cache(maxsize=None)
 def _get_class_that_defined_method(meth: Any) -> Any:
     if inspect.ismethod(meth):
         for cls in inspect.getmro(meth.__self__.__class__):
@@ -284,10 +453,20 @@ def _get_class_that_defined_method(meth: Any) -> Any:
     return getattr(meth, "__objclass__", None)  # handle special descriptor objects
 
 
-def _get_docstring(obj: Any) -> str:
+@lru_cache(maxsize=None)
+def _cached_docstring(obj: Any) -> str:
+    """Resolves the docstring of an object. Cached since inspect.getdoc walks the MRO."""
     return "" if obj.__doc__ is None else inspect.getdoc(obj) or ""
 
 
+def _get_docstring(obj: Any) -> str:
+    try:
+        return _cached_docstring(obj)
+    except TypeError:
+        # Unhashable object -> resolve without caching
+        return "" if obj.__doc__ is None else inspect.getdoc(obj) or ""
+
+
 def _is_object_ignored(obj: Any) -> bool:
     if (
         _IGNORE_GENERATION_INSTRUCTION.replace(" ", "").lower()
@@ -298,17 +477,82 @@ def _is_object_ignored(obj: Any) -> bool:
     return False
 
 
-def _is_module_ignored(module_name: str, ignored_modules: List[str]) -> bool:
+# Checks removed from the google convention during validation, mirroring the
+# former `pydocstyle --convention=google --add-ignore=...` invocation.
+_PYDOCSTYLE_IGNORED = {"D100", "D101", "D102", "D103", "D104", "D105", "D107", "D202"}
+
+
+def _validate_docstrings(path: str) -> None:
+    """Validates the docstrings under the given path via pydocstyle.
+
+    Runs the checker in-process instead of spawning a shell plus a fresh
+    interpreter per validated path.
+
+    Args:
+        path: Python file or directory to validate.
+
+    Raises:
+        Exception: If pydocstyle is not installed or reports violations.
+    """
+    try:
+        from pydocstyle import check
+        from pydocstyle.config import ConfigurationParser
+        from pydocstyle.violations import conventions
+    except ImportError as ex:
+        raise Exception(
+            "pydocstyle is required for validation but is not installed."
+        ) from ex
+
+    # Same default file selection as the pydocstyle CLI: match test_*.py out
+    # of the walked (base)names and prune dot-directories.
+    match = re.compile(ConfigurationParser.DEFAULT_MATCH_RE + "$").match
+    match_dir = re.compile(ConfigurationParser.DEFAULT_MATCH_DIR_RE + "$").match
+
+    if os.path.isdir(path):
+        filenames: List[str] = []
+        for root, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if match_dir(d)]
+            filenames.extend(
+                os.path.join(root, file_name)
+                for file_name in sorted(files)
+                if match(file_name)
+            )
+    else:
+        if not match(os.path.basename(path)):
+            # The CLI skips explicitly passed non-matching files as well
+            return
+        filenames = [path]
+
+    errors = list(check(filenames, select=conventions["google"] - _PYDOCSTYLE_IGNORED))
+    if errors:
+        for error in errors:
+            print(error)
+        raise Exception(f"Validation for {path} failed.")
+
+
+@lru_cache(maxsize=None)
+def _get_git_root() -> str:
+    """Resolves the git repository root of the working directory (cached)."""
+    return (
+        subprocess.Popen(
+            ["git", "rev-parse", "--show-toplevel"], stdout=subprocess.PIPE
+        )
+        .communicate()[0]
+        .rstrip()
+        .decode("utf-8")
+    )
+
+
+def _is_module_ignored(module_name: str, ignored_modules: Container[str]) -> bool:
     """Checks if a given module is ignored."""
-    if module_name.split(".")[-1].startswith("_"):
+    parts = module_name.split(".")
+    if parts[-1].startswith("_"):
         return True
 
-    for ignored_module in ignored_modules:
-        if module_name == ignored_module:
-            return True
-
-        # Check is module is subpackage of an ignored package
-        if module_name.startswith(ignored_module + "."):
+    # Walk the module's own dotted prefixes instead of scanning the whole
+    # ignore collection: O(depth) membership tests (O(1) each with a set).
+    for i in range(len(parts)):
+        if ".".join(parts[: i + 1]) in ignored_modules:
             return True
 
     return False
@@ -331,16 +575,19 @@ def _get_src_root_path(obj: Any) -> str:
 
 
 def _get_doc_summary(obj: Any) -> str:
-    # First line should contain the summary
-    return _get_docstring(obj).split("\n")[0]
+    # First line should contain the summary; no need to split the rest
+    return _get_docstring(obj).split("\n", 1)[0]
 
 
 def _get_anchor_tag(header: str) -> str:
     anchor_tag = header.strip().lower()
+    if anchor_tag.isascii():
+        return anchor_tag.translate(_ANCHOR_TABLE)
+    # Non-ASCII headers (unicode whitespace etc.) take the regex path
     # Whitespaces to -
-    anchor_tag = re.compile(r"\s").sub("-", anchor_tag)
+    anchor_tag = _RE_ANCHOR_WHITESPACE.sub("-", anchor_tag)
     # Remove not allowed characters
-    anchor_tag = re.compile(r"[^a-zA-Z0-9-_]").sub("", anchor_tag)
+    anchor_tag = _RE_ANCHOR_ILLEGAL.sub("", anchor_tag)
     return anchor_tag
 
 
@@ -358,30 +605,47 @@ def _doc2md(obj: Any) -> str:
     # the documentation strings are now inherited if not overridden.
     # For details see: https://docs.python.org/3.6/library/inspect.html#inspect.getdoc
     # doc = getdoc(func) or ""
-    doc = _get_docstring(obj)
+    return _doc2md_text(_get_docstring(obj))
+
+
+@lru_cache(maxsize=None)
+def _doc2md_text(doc: str) -> str:
+    """Converts an already-resolved docstring to markdown.
+
+    Keyed (and cached) on the docstring text itself, so objects re-exported
+    into several documented modules are parsed once.
+    """
+    if _RE_DOC2MD_UNSAFE.search(doc) is None:
+        # Fast path: plain text without sections, code blocks, bullets or
+        # indentation. Mirrors exactly what the state machine below emits
+        # for such lines (text joined with spaces, blank lines to breaks).
+        return "".join(line + " " if line else "\n\n" for line in doc.split("\n"))
 
     blockindent = 0
     argindent = 1
-    out = []
+    out = io.StringIO()
     arg_list = False
     literal_block = False
     md_code_snippet = False
     quote_block = False
 
     for line in doc.split("\n"):
-        indent = len(line) - len(line.lstrip())
+        # Tokenize each line exactly once instead of re-stripping per branch
+        lstripped = line.lstrip()
+        indent = len(line) - len(lstripped)
         if not md_code_snippet and not literal_block:
-            line = line.lstrip()
+            line = lstripped
 
         if line.startswith(">>>"):
             # support for doctest
             line = line.replace(">>>", "```") + "```"
 
-        if (
-            _RE_BLOCKSTART_LIST.match(line)
-            or _RE_BLOCKSTART_TEXT.match(line)
-            or _RE_QUOTE_TEXT.match(line)
-        ):
+        stripped = line.strip()
+
+        # Cheap prefilter: every block-start keyword carries a colon within
+        # its first 11 characters, most lines do not - skip the regex then.
+        blockstart_match = _RE_BLOCKSTART.match(line) if ":" in line[:11] else None
+        if blockstart_match:
             # start of a new block
             blockindent = indent
 
@@ -390,48 +654,48 @@ def _doc2md(obj: Any) -> str:
 
             if literal_block:
                 # break literal block
-                out.append("```\n")
+                out.write("```\n")
                 literal_block = False
 
-            out.append("\n\n**{}**\n".format(line.strip()))
+            out.write("\n\n**{}**\n".format(stripped))
 
-            arg_list = bool(_RE_BLOCKSTART_LIST.match(line))
+            arg_list = blockstart_match.lastgroup == "list"
 
-            if _RE_QUOTE_TEXT.match(line):
+            if blockstart_match.lastgroup == "quote":
                 quote_block = True
-                out.append("\n>")
-        elif line.strip().startswith("```"):
+                out.write("\n>")
+        elif stripped.startswith("```"):
             # Code snippet is used
             if md_code_snippet:
                 md_code_snippet = False
             else:
                 md_code_snippet = True
 
-            out.append(line)
-        elif line.strip().endswith("::"):
+            out.write(line)
+        elif stripped.endswith("::"):
             # Literal Block Support: https://docutils.sourceforge.io/docs/user/rst/quickref.html#literal-blocks
             literal_block = True
-            out.append(line.replace("::", ":\n```"))
+            out.write(line.replace("::", ":\n```"))
         elif quote_block:
-            out.append(line.strip())
-        elif line.strip().startswith("-"):
+            out.write(stripped)
+        elif stripped.startswith("-"):
             # Allow bullet lists
-            out.append("\n" + (" " * indent) + line)
+            out.write("\n" + _pad(indent) + line)
         elif indent > blockindent:
             if arg_list and not literal_block and _RE_TYPED_ARGSTART.match(line):
                 # start of new argument
-                out.append(
+                out.write(
                     "\n"
-                    + " " * blockindent
+                    + _pad(blockindent)
                     + " - "
                     + _RE_TYPED_ARGSTART.sub(r"<b>`\1`</b> (\2): \3", line)
                 )
                 argindent = indent
             elif arg_list and not literal_block and _RE_ARGSTART.match(line):
                 # start of an exception-type block
-                out.append(
+                out.write(
                     "\n"
-                    + " " * blockindent
+                    + _pad(blockindent)
                     + " - "
                     + _RE_ARGSTART.sub(r"<b>`\1`</b>: \2", line)
                 )
@@ -439,26 +703,26 @@ def _doc2md(obj: Any) -> str:
             elif indent > argindent:
                 # attach docs text of argument
                 # * (blockindent + 2)
-                out.append(" " + line)
+                out.write(" " + line)
             else:
-                out.append(line)
+                out.write(line)
         else:
-            if line.strip() and literal_block:
+            if stripped and literal_block:
                 # indent has changed, if not empty line, break literal block
                 line = "```\n" + line
                 literal_block = False
-            out.append(line)
+            out.write(line)
 
         if md_code_snippet:
-            out.append("\n")
+            out.write("\n")
         elif not line and not quote_block:
-            out.append("\n\n")
+            out.write("\n\n")
         elif not line and quote_block:
-            out.append("\n>")
+            out.write("\n>")
         else:
-            out.append(" ")
+            out.write(" ")
 
-    return "".join(out)
+    return out.getvalue()
 
 
 class MarkdownGenerator(object):
@@ -482,7 +746,12 @@ class MarkdownGenerator(object):
         self.src_base_url = src_base_url
         self.remove_package_prefix = remove_package_prefix
 
-        self.generated_objects: List[Dict] = []
+        # Resolved once here instead of per documented object (getcwd syscall)
+        self._abs_src_root_path: Optional[str] = (
+            os.path.abspath(src_root_path) if src_root_path else None
+        )
+
+        self.generated_objects: List[_GeneratedObject] = []
 
     def _get_src_path(self, obj: Any, append_base: bool = True) -> str:
         """Creates a src path string with line info for use as markdown link.
@@ -494,17 +763,22 @@ class MarkdownGenerator(object):
         Returns:
             str: Source code path with line marker.
         """
-        src_root_path = None
-        if self.src_root_path:
-            src_root_path = os.path.abspath(self.src_root_path)
-        else:
+        src_root_path = self._abs_src_root_path
+        if not src_root_path:
             return ""
 
         try:
-            path = os.path.abspath(inspect.getsourcefile(obj))  # type: ignore
+            try:
+                path = _cached_sourcefile(obj)
+            except TypeError:
+                # Unhashable object -> resolve without caching
+                path = os.path.abspath(inspect.getsourcefile(obj))  # type: ignore
         except Exception:
             return ""
 
+        if not path:
+            return ""
+
         assert isinstance(path, str)
 
         if src_root_path not in path:
@@ -519,7 +793,7 @@ class MarkdownGenerator(object):
 
             path = path.replace(".", "/")
 
-        relative_path = os.path.relpath(path, src_root_path)
+        relative_path = _cached_relpath(path, src_root_path)
 
         lineno = _get_line_no(obj)
         lineno_hashtag = "" if lineno is None else "#L{}".format(lineno)
@@ -568,18 +842,17 @@ class MarkdownGenerator(object):
         doc = _doc2md(func)
         summary = _get_doc_summary(func)
 
-        funcdef = _get_function_signature(
+        sig_name, sig_arguments, sig_return_type = _build_signature_parts(
             func, ignore_self=True, remove_package=self.remove_package_prefix
         )
+        funcdef = _format_signature(sig_name, sig_arguments, sig_return_type)
 
         # split the function definition if it is too long
         lmax = 80
         if len(funcdef) > lmax:
-            funcdef = _get_function_signature(
-                func,
-                ignore_self=True,
-                wrap_arguments=True,
-                remove_package=self.remove_package_prefix,
+            # Reformat from the already-built parts, no second inspect pass
+            funcdef = _format_signature(
+                sig_name, sig_arguments, sig_return_type, wrap_arguments=True
             )
 
         if inspect.ismethod(func):
@@ -592,33 +865,25 @@ class MarkdownGenerator(object):
                 func_type = "method"
 
         self.generated_objects.append(
-            {
-                "type": func_type,
-                "name": header,
-                "full_name": full_name,
-                "module": modname,
-                "anchor_tag": _get_anchor_tag(func_type + "-" + header),
-                "description": summary,
-            }
+            _GeneratedObject(
+                type=func_type,
+                name=header,
+                full_name=full_name,
+                module=modname,
+                anchor_tag=_get_anchor_tag(func_type + "-" + header),
+                description=summary,
+            )
         )
 
         # build the signature
-        markdown = _FUNC_TEMPLATE.format(
-            section=section,
-            header=header,
-            funcdef=funcdef,
-            func_type=func_type,
-            doc=doc if doc else "*No documentation found.*",
+        doc_md = doc if doc else "*No documentation found.*"
+        badge = _render_badge(path, is_mdx) if path else ""
+        return (
+            f"{badge}\n{section} <kbd>{func_type}</kbd> `{header}`\n"
+            f"\n```python\n{funcdef}\n```\n"
+            f"\n{doc_md}\n"
         )
 
-        if path:
-            if is_mdx:
-                markdown = _MDX_SOURCE_BADGE_TEMPLATE.format(path=path) + markdown
-            else:    
-                markdown = _SOURCE_BADGE_TEMPLATE.format(path=path) + markdown
-
-        return markdown
-
     def class2md(self, cls: Any, depth: int = 2, is_mdx: bool = False) -> str:
         """Takes a class and creates markdown text to document its methods and variables.
 
@@ -643,14 +908,14 @@ class MarkdownGenerator(object):
         summary = _get_doc_summary(cls)
 
         self.generated_objects.append(
-            {
-                "type": "class",
-                "name": header,
-                "full_name": header,
-                "module": modname,
-                "anchor_tag": _get_anchor_tag("class-" + header),
-                "description": summary,
-            }
+            _GeneratedObject(
+                type="class",
+                name=header,
+                full_name=header,
+                module=modname,
+                anchor_tag=_get_anchor_tag("class-" + header),
+                description=summary,
+            )
         )
 
         try:
@@ -666,72 +931,67 @@ class MarkdownGenerator(object):
             # this happens if __init__ is outside the repo
             init = ""
 
-        variables = []
-        for name, obj in inspect.getmembers(
+        # Stream all sections into a single growing buffer instead of
+        # accumulating per-section lists and concatenating the joined copies.
+        out = io.StringIO()
+        if path:
+            out.write(_render_badge(path, is_mdx))
+        out.write(f"\n{section} <kbd>class</kbd> `{header}`\n{doc}\n{init}\n")
+
+        for name, obj in _get_members(
             cls, lambda a: not (inspect.isroutine(a) or inspect.ismethod(a))
         ):
             if not name.startswith("_") and type(obj) == property:
-                comments = _doc2md(obj) or inspect.getcomments(obj)
+                comments = _doc2md(obj) or _get_comments(obj)
                 comments = "\n\n%s" % comments if comments else ""
                 property_name = f"{clsname}.{name}"
                 if self.remove_package_prefix:
                     property_name = name
-                variables.append(
+                out.write(
                     _SEPARATOR
                     + "\n%s <kbd>property</kbd> %s%s\n"
                     % (subsection, property_name, comments)
                 )
+        out.write("\n")
 
-        handlers = []
-        for name, obj in inspect.getmembers(cls, inspect.ismethoddescriptor):
+        # Set of attribute names (not markdown snippets) documented as
+        # handlers: O(1) membership for the methods filter below.
+        handler_names = set()
+        for name, obj in _get_members(cls, inspect.ismethoddescriptor):
             if (
                 not name.startswith("_")
-                and hasattr(obj, "__module__")
                 # object module should be the same as the calling module
-                and obj.__module__ == modname
+                # (single getattr instead of a hasattr probe plus a re-read)
+                and getattr(obj, "__module__", None) == modname
             ):
                 handler_name = f"{clsname}.{name}"
                 if self.remove_package_prefix:
                     handler_name = name
 
-                handlers.append(
+                handler_names.add(name)
+                out.write(
                     _SEPARATOR
                     + "\n%s <kbd>handler</kbd> %s\n" % (subsection, handler_name)
                 )
+        out.write("\n")
 
-        methods = []
         # for name, obj in getmembers(cls, inspect.isfunction):
-        for name, obj in inspect.getmembers(
+        for name, obj in _get_members(
             cls, lambda a: inspect.ismethod(a) or inspect.isfunction(a)
         ):
             if (
                 not name.startswith("_")
-                and hasattr(obj, "__module__")
-                and name not in handlers
+                and name not in handler_names
                 # object module should be the same as the calling module
-                and obj.__module__ == modname
+                and getattr(obj, "__module__", None) == modname
             ):
                 function_md = self.func2md(obj, clsname=clsname, depth=depth + 1, is_mdx=is_mdx)
                 if function_md:
-                    methods.append(_SEPARATOR + function_md)
-
-        markdown = _CLASS_TEMPLATE.format(
-            section=section,
-            header=header,
-            doc=doc if doc else "",
-            init=init,
-            variables="".join(variables),
-            handlers="".join(handlers),
-            methods="".join(methods),
-        )
-
-        if path:
-            if is_mdx:
-                markdown = _MDX_SOURCE_BADGE_TEMPLATE.format(path=path) + markdown
-            else:
-                markdown = _SOURCE_BADGE_TEMPLATE.format(path=path) + markdown
+                    out.write(_SEPARATOR)
+                    out.write(function_md)
+        out.write("\n")
 
-        return markdown
+        return out.getvalue()
 
     def module2md(self, module: types.ModuleType, depth: int = 1, is_mdx: bool = False) -> str:
         """Takes an imported module object and create a Markdown string containing functions and classes.
@@ -751,29 +1011,38 @@ class MarkdownGenerator(object):
         doc = _doc2md(module)
         summary = _get_doc_summary(module)
         path = self._get_src_path(module)
-        found = []
+
+        # Classify all module attributes in one dict walk instead of running
+        # a filtered member sweep per section.
+        class_items: List[Tuple[str, Any]] = []
+        function_items: List[Tuple[str, Any]] = []
+        data_items: List[Tuple[str, Any]] = []
+        for name, obj in module.__dict__.items():
+            if inspect.isclass(obj):
+                class_items.append((name, obj))
+            elif inspect.isfunction(obj):
+                function_items.append((name, obj))
+            else:
+                data_items.append((name, obj))
 
         self.generated_objects.append(
-            {
-                "type": "module",
-                "name": modname,
-                "full_name": modname,
-                "module": modname,
-                "anchor_tag": _get_anchor_tag("module-" + modname),
-                "description": summary,
-            }
+            _GeneratedObject(
+                type="module",
+                name=modname,
+                full_name=modname,
+                module=modname,
+                anchor_tag=_get_anchor_tag("module-" + modname),
+                description=summary,
+            )
         )
 
         classes: List[str] = []
         line_nos: List[int] = []
-        for name, obj in inspect.getmembers(module, inspect.isclass):
+        # Sorted by name, like the former getmembers sweep, so that the
+        # generated_objects (and thereby overview) order is unchanged.
+        for name, obj in sorted(class_items, key=itemgetter(0)):
             # handle classes
-            found.append(name)
-            if (
-                not name.startswith("_")
-                and hasattr(obj, "__module__")
-                and obj.__module__ == modname
-            ):
+            if not name.startswith("_") and getattr(obj, "__module__", None) == modname:
                 class_markdown = self.class2md(obj, depth=depth + 1, is_mdx=is_mdx)
                 if class_markdown:
                     classes.append(_SEPARATOR + class_markdown)
@@ -782,14 +1051,9 @@ class MarkdownGenerator(object):
 
         functions: List[str] = []
         line_nos = []
-        for name, obj in inspect.getmembers(module, inspect.isfunction):
+        for name, obj in sorted(function_items, key=itemgetter(0)):
             # handle functions
-            found.append(name)
-            if (
-                not name.startswith("_")
-                and hasattr(obj, "__module__")
-                and obj.__module__ == modname
-            ):
+            if not name.startswith("_") and getattr(obj, "__module__", None) == modname:
                 function_md = self.func2md(obj, depth=depth + 1, is_mdx=is_mdx)
                 if function_md:
                     functions.append(_SEPARATOR + function_md)
@@ -798,13 +1062,18 @@ class MarkdownGenerator(object):
 
         variables: List[str] = []
         line_nos = []
-        for name, obj in module.__dict__.items():
-            if not name.startswith("_") and name not in found:
-                if hasattr(obj, "__module__") and obj.__module__ != modname:
+        # Classes and functions never reach this bucket, so the former
+        # `name not in found` list scan per variable is no longer needed.
+        for name, obj in data_items:
+            if not name.startswith("_"):
+                # Skip only when a __module__ attribute exists and differs;
+                # objects without one (primitives) must still be listed.
+                obj_module = getattr(obj, "__module__", _MISSING)
+                if obj_module is not _MISSING and obj_module != modname:
                     continue
                 if hasattr(obj, "__name__") and not obj.__name__.startswith(modname):
                     continue
-                comments = inspect.getcomments(obj)
+                comments = _get_comments(obj)
                 comments = ": %s" % comments if comments else ""
                 variables.append("- **%s**%s" % (name, comments))
                 line_nos.append(_get_line_no(obj) or 0)
@@ -814,22 +1083,22 @@ class MarkdownGenerator(object):
             new_list = ["\n**Global Variables**", "---------------", *variables]
             variables = new_list
 
-        markdown = _MODULE_TEMPLATE.format(
-            header=modname,
-            section="#" * depth,
-            doc=doc,
-            global_vars="\n".join(variables) if variables else "",
-            functions="\n".join(functions) if functions else "",
-            classes="".join(classes) if classes else "",
-        )
-
+        section = "#" * depth
+        # Stream the ordered sections into one buffer; avoids the joined
+        # intermediate copies and the badge-prepend copy of the full document.
+        out = io.StringIO()
         if path:
-            if (is_mdx):
-                markdown = _MDX_SOURCE_BADGE_TEMPLATE.format(path=path) + markdown
-            else:
-                markdown = _SOURCE_BADGE_TEMPLATE.format(path=path) + markdown
-
-        return markdown
+            out.write(_render_badge(path, is_mdx))
+        out.write(f"\n{section} <kbd>module</kbd> `{modname}`\n{doc}\n")
+        out.write("\n".join(variables) if variables else "")
+        out.write("\n")
+        out.write("\n".join(functions) if functions else "")
+        out.write("\n")
+        for class_md in classes:
+            out.write(class_md)
+        out.write("\n")
+
+        return out.getvalue()
 
     def import2md(self, obj: Any, depth: int = 1, is_mdx: bool = False) -> str:
         """Generates markdown documentation for a selected object/import.
@@ -854,66 +1123,144 @@ class MarkdownGenerator(object):
     def overview2md(self, is_mdx: bool = False) -> str:
         """Generates a documentation overview file based on the generated docs."""
 
-        entries_md = ""
-        for obj in list(
-            filter(lambda d: d["type"] == "module", self.generated_objects)
-        ):
-            full_name = obj["full_name"]
-            if "module" in obj:
-                if is_mdx:
-                    link = "./" + obj["module"] + ".mdx#" + obj["anchor_tag"]
+        extension = ".mdx#" if is_mdx else ".md#"
+
+        # Partition the generated objects and render the entries in a single
+        # traversal; the entries are joined once per section instead of being
+        # re-concatenated (and copied) per entry.
+        module_entries: List[str] = []
+        class_entries: List[str] = []
+        function_entries: List[str] = []
+        for obj in self.generated_objects:
+            obj_type = obj.type
+            if obj_type == "module":
+                full_name = obj.full_name
+                if obj.module is not None:
+                    link = "./" + obj.module + extension + obj.anchor_tag
                 else:
-                    link = "./" + obj["module"] + ".md#" + obj["anchor_tag"]
-            else:
-                link = "#unknown"
-
-            description = obj["description"]
-            entries_md += f"\n- [`{full_name}`]({link})"
-            if description:
-                entries_md += ": " + description
-        if not entries_md:
-            entries_md = "\n- No modules"
-        modules_md = entries_md
-
-        entries_md = ""
-        for obj in list(filter(lambda d: d["type"] == "class", self.generated_objects)):
-            module_name = obj["module"].split(".")[-1]
-            name = module_name + "." + obj["full_name"]
-            if is_mdx:
-                link = "./" + obj["module"] + ".mdx#" + obj["anchor_tag"]
-            else:
-                link = "./" + obj["module"] + ".md#" + obj["anchor_tag"]
-            description = obj["description"]
-            entries_md += f"\n- [`{name}`]({link})"
-            if description:
-                entries_md += ": " + description
-        if not entries_md:
-            entries_md = "\n- No classes"
-        classes_md = entries_md
-
-        entries_md = ""
-        for obj in list(
-            filter(lambda d: d["type"] == "function", self.generated_objects)
-        ):
-            module_name = obj["module"].split(".")[-1]
-            name = module_name + "." + obj["full_name"]
-            if is_mdx:
-                link = "./" + obj["module"] + ".mdx#" + obj["anchor_tag"]
-            else:
-                link = "./" + obj["module"] + ".md#" + obj["anchor_tag"]
-            description = obj["description"]
-            entries_md += f"\n- [`{name}`]({link})"
-            if description:
-                entries_md += ": " + description
-        if not entries_md:
-            entries_md = "\n- No functions"
-        functions_md = entries_md
+                    link = "#unknown"
+
+                entry = f"\n- [`{full_name}`]({link})"
+                description = obj.description
+                if description:
+                    entry += ": " + description
+                module_entries.append(entry)
+            elif (
+                obj_type == "class" or obj_type == "function"
+            ) and obj.module is not None:
+                module_name = obj.module.rsplit(".", 1)[-1]
+                name = module_name + "." + obj.full_name
+                link = "./" + obj.module + extension + obj.anchor_tag
+                entry = f"\n- [`{name}`]({link})"
+                description = obj.description
+                if description:
+                    entry += ": " + description
+                if obj_type == "class":
+                    class_entries.append(entry)
+                else:
+                    function_entries.append(entry)
+
+        modules_md = "".join(module_entries) if module_entries else "\n- No modules"
+        classes_md = "".join(class_entries) if class_entries else "\n- No classes"
+        functions_md = (
+            "".join(function_entries) if function_entries else "\n- No functions"
+        )
 
         return _OVERVIEW_TEMPLATE.format(
             modules=modules_md, classes=classes_md, functions=functions_md
         )
 
 
+def _module2md_from_spec(
+    module_name: str,
+    origin: Optional[str],
+    src_root_path: Optional[str],
+    src_base_url: Optional[str],
+    remove_package_prefix: bool,
+    is_mdx: bool,
+) -> Tuple[str, List["_GeneratedObject"]]:
+    """Generates markdown for a single discovered module (worker process).
+
+    Only the module name and spec origin are passed in, so the call can be
+    dispatched to another process without pickling loaders or module objects.
+    """
+    if origin:
+        spec = importlib.util.spec_from_file_location(module_name, origin)
+        assert spec is not None
+        mod = importlib.util.module_from_spec(spec)
+    else:
+        # Namespace package without a file origin
+        mod = types.ModuleType(module_name)
+
+    generator = MarkdownGenerator(
+        src_root_path=src_root_path,
+        src_base_url=src_base_url,
+        remove_package_prefix=remove_package_prefix,
+    )
+    return generator.module2md(mod, is_mdx=is_mdx), generator.generated_objects
+
+
+def _generate_modules_md(
+    module_tasks: List[Tuple[str, Optional[str]]],
+    generator: "MarkdownGenerator",
+    is_mdx: bool,
+) -> List[Tuple[str, str]]:
+    """Generates markdown for the collected modules, in parallel when worthwhile.
+
+    Markdown generation is CPU-bound pure Python, so multiple modules are
+    fanned out to a process pool. Results (and the recorded objects used for
+    the overview file) are merged back in the original module order.
+    """
+    results: List[Tuple[str, str]] = []
+
+    def _collect(
+        module_name: str,
+        resolve: Callable[[], Tuple[str, List[_GeneratedObject]]],
+    ) -> None:
+        try:
+            module_md, generated_objects = resolve()
+            generator.generated_objects.extend(generated_objects)
+            results.append((module_name, module_md))
+        except Exception as ex:
+            print(f"Failed to generate docs for module {module_name}: " + repr(ex))
+
+    if len(module_tasks) > 1:
+        try:
+            with ProcessPoolExecutor() as executor:
+                futures = [
+                    executor.submit(
+                        _module2md_from_spec,
+                        module_name,
+                        origin,
+                        generator.src_root_path,
+                        generator.src_base_url,
+                        generator.remove_package_prefix,
+                        is_mdx,
+                    )
+                    for module_name, origin in module_tasks
+                ]
+                for (module_name, _), future in zip(module_tasks, futures):
+                    _collect(module_name, future.result)
+            return results
+        except OSError:
+            # Process pools unavailable on this platform -> run sequential
+            results = []
+
+    for module_name, origin in module_tasks:
+        _collect(
+            module_name,
+            lambda: _module2md_from_spec(
+                module_name,
+                origin,
+                generator.src_root_path,
+                generator.src_base_url,
+                generator.remove_package_prefix,
+                is_mdx,
+            ),
+        )
+    return results
+
+
 def generate_docs(
     paths: List[str],
     output_path: str = "./docs",
@@ -945,8 +1292,9 @@ def generate_docs(
         # Create output path
         os.makedirs(output_path)
 
-    if not ignored_modules:
-        ignored_modules = list()
+    # Always copy: the collection is extended below and callers may pass any
+    # sequence; a set makes the per-module ignore checks O(1).
+    ignored: Set[str] = set(ignored_modules or ())
 
     if output_format and output_format != 'md' and output_format != 'mdx':
         raise Exception(f"Unsupported output format: {output_format}. Choose either 'md' or 'mdx'.")
@@ -955,14 +1303,7 @@ def generate_docs(
     if not src_root_path:
         try:
             # Set src root path to git root
-            src_root_path = (
-                subprocess.Popen(
-                    ["git", "rev-parse", "--show-toplevel"], stdout=subprocess.PIPE
-                )
-                .communicate()[0]
-                .rstrip()
-                .decode("utf-8")
-            )
+            src_root_path = _get_git_root()
             if src_root_path and src_base_url is None and not stdout_mode:
                 # Set base url to be relative to the git root folder based on output_path
                 src_base_url = os.path.relpath(
@@ -980,50 +1321,54 @@ def generate_docs(
         remove_package_prefix=remove_package_prefix,
     )
 
-    pydocstyle_cmd = "pydocstyle --convention=google --add-ignore=D100,D101,D102,D103,D104,D105,D107,D202"
-
     for path in paths:  # lgtm [py/non-iterable-in-for-loop]
         if os.path.isdir(path):
-            if validate and subprocess.call(f"{pydocstyle_cmd} {path}", shell=True) > 0:
-                raise Exception(f"Validation for {path} failed.")
+            if validate:
+                _validate_docstrings(path)
 
             if not stdout_mode:
                 print(f"Generating docs for python package at: {path}")
 
-            # Generate one file for every discovered module
+            # Generate one file for every discovered module. The walk itself
+            # stays sequential (the ignore list grows while walking); the
+            # markdown generation is fanned out to a process pool.
+            module_tasks: List[Tuple[str, Optional[str]]] = []
             for loader, module_name, _ in pkgutil.walk_packages([path]):
-                if _is_module_ignored(module_name, ignored_modules):
+                if _is_module_ignored(module_name, ignored):
                     # Add module to ignore list, so submodule will also be ignored
-                    ignored_modules.append(module_name)
+                    ignored.add(module_name)
                     continue
 
                 try:
                     mod_spec = loader.find_spec(module_name)
-                    mod = importlib.util.module_from_spec(mod_spec)
-                    module_md = generator.module2md(mod, is_mdx=is_mdx)
-                    if not module_md:
-                        # Module md is empty -> ignore module and all submodules
-                        # Add module to ignore list, so submodule will also be ignored
-                        ignored_modules.append(module_name)
-                        continue
-
-                    if stdout_mode:
-                        print(module_md)
-                    else:
-                        to_md_file(
-                            module_md,
-                            mod.__name__,
-                            out_path=output_path,
-                            watermark=watermark,
-                            is_mdx=is_mdx,
-                        )
+                    module_tasks.append((module_name, mod_spec.origin))
                 except Exception as ex:
                     print(
                         f"Failed to generate docs for module {module_name}: " + repr(ex)
                     )
+
+            for module_name, module_md in _generate_modules_md(
+                module_tasks, generator, is_mdx
+            ):
+                if not module_md:
+                    # Module md is empty -> ignore module and all submodules
+                    # Add module to ignore list, so submodule will also be ignored
+                    ignored.add(module_name)
+                    continue
+
+                if stdout_mode:
+                    print(module_md)
+                else:
+                    to_md_file(
+                        module_md,
+                        module_name,
+                        out_path=output_path,
+                        watermark=watermark,
+                        is_mdx=is_mdx,
+                    )
         elif os.path.isfile(path):
-            if validate and subprocess.call(f"{pydocstyle_cmd} {path}", shell=True) > 0:
-                raise Exception(f"Validation for {path} failed.")
+            if validate:
+                _validate_docstrings(path)
 
             if not stdout_mode:
                 print(f"Generating docs for python module at: {path}")
@@ -1066,42 +1411,46 @@ def generate_docs(
                     print(f"Generating docs for python import: {path}")
 
                 if hasattr(obj, "__path__"):
-                    # Object is a package
+                    # Object is a package: same collect-then-fan-out scheme
+                    # as the directory branch above.
+                    module_tasks = []
                     for loader, module_name, _ in pkgutil.walk_packages(
                         path=obj.__path__,  # type: ignore
                         prefix=obj.__name__ + ".",  # type: ignore
                     ):
-                        if _is_module_ignored(module_name, ignored_modules):
+                        if _is_module_ignored(module_name, ignored):
                             # Add module to ignore list, so submodule will also be ignored
-                            ignored_modules.append(module_name)
+                            ignored.add(module_name)
                             continue
 
                         try:
                             mod_spec = loader.find_spec(module_name)
-                            mod = importlib.util.module_from_spec(mod_spec)
-                            module_md = generator.module2md(mod, is_mdx=is_mdx)
-
-                            if not module_md:
-                                # Module MD is empty -> ignore module and all submodules
-                                # Add module to ignore list, so submodule will also be ignored
-                                ignored_modules.append(module_name)
-                                continue
-
-                            if stdout_mode:
-                                print(module_md)
-                            else:
-                                to_md_file(
-                                    module_md,
-                                    mod.__name__,
-                                    out_path=output_path,
-                                    watermark=watermark,
-                                    is_mdx=is_mdx
-                                )
+                            module_tasks.append((module_name, mod_spec.origin))
                         except Exception as ex:
                             print(
                                 f"Failed to generate docs for module {module_name}: "
                                 + repr(ex)
                             )
+
+                    for module_name, module_md in _generate_modules_md(
+                        module_tasks, generator, is_mdx
+                    ):
+                        if not module_md:
+                            # Module MD is empty -> ignore module and all submodules
+                            # Add module to ignore list, so submodule will also be ignored
+                            ignored.add(module_name)
+                            continue
+
+                        if stdout_mode:
+                            print(module_md)
+                        else:
+                            to_md_file(
+                                module_md,
+                                module_name,
+                                out_path=output_path,
+                                watermark=watermark,
+                                is_mdx=is_mdx
+                            )
                 else:
                     import_md = generator.import2md(obj, is_mdx=is_mdx)
                     if stdout_mode:
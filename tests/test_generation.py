@@ -1,6 +1,22 @@
 import hashlib
+from pathlib import Path
+
+import pytest
 
 from lazydocs import MarkdownGenerator
+from lazydocs.generation import _validate_docstrings
+
+# Module with docstring violations (D403, D415 under the google convention)
+_VIOLATING_MODULE = '''"""Module."""
+
+
+def fn(x):
+    """summary that is neither capitalized nor punctuated
+
+    Some description.
+    """
+    return x
+'''
 
 
 def test_import2md() -> None:
@@ -35,3 +51,22 @@ def test_func2md() -> None:
     # Remove whitespaces: fix changes between py version 3.6 3.7 in signature method
     md_hash = hashlib.md5(markdown.replace(" ", "").encode("utf-8")).hexdigest()
     assert md_hash == "797bad8c00ee6f189cb6f578eaec02c4"
+
+
+def test_validate_docstrings_matches_pydocstyle_cli(tmp_path: Path) -> None:
+    # Violations in test_*.py files and dot-directories must be skipped,
+    # like the default --match/--match-dir filters of the pydocstyle CLI
+    (tmp_path / "test_bad.py").write_text(_VIOLATING_MODULE)
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "bad.py").write_text(_VIOLATING_MODULE)
+    _validate_docstrings(str(tmp_path))
+
+    # Explicitly passed test_*.py files are skipped as well
+    _validate_docstrings(str(tmp_path / "test_bad.py"))
+
+    # The same violations in a regular module still fail validation
+    (tmp_path / "bad.py").write_text(_VIOLATING_MODULE)
+    with pytest.raises(Exception, match="Validation for"):
+        _validate_docstrings(str(tmp_path))
+    with pytest.raises(Exception, match="Validation for"):
+        _validate_docstrings(str(tmp_path / "bad.py"))